@@ -2,23 +2,69 @@
 from __future__ import annotations
 
 import multiprocessing
+import os
+from pathlib import Path
+from shutil import copy, rmtree
+from tempfile import mkdtemp
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-from ase.calculators.gaussian import Gaussian
+from ase.calculators.calculator import CalculationFailed
+from ase.calculators.gaussian import Gaussian, GaussianIRC, GaussianOptimizer
+from monty.os.path import zpath
 
-from quacc import fetch_atoms, job
+from quacc import SETTINGS, fetch_atoms, job
 from quacc.runners.calc import run_calc
 from quacc.schemas.cclib import cclib_summarize_run
 from quacc.utils.dicts import merge_dicts
+from quacc.utils.files import check_logfile
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     from ase import Atoms
+    from ase.calculators.gaussian import GaussianDynamics
 
     from quacc.schemas.cclib import cclibSchema
 
 LOG_FILE = f"{Gaussian().label}.log"
 GEOM_FILE = LOG_FILE
 
+# Use the CPU affinity mask, where available, so that cgroup limits (e.g. in
+# SLURM jobs or containers) are respected and Gaussian is not oversubscribed.
+_NPROCSHARED = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else multiprocessing.cpu_count()
+)
+
+# Immutable portions of the calculator defaults, shared across all calls so the
+# job bodies only need to splat the per-call entries on top.
+_STATIC_DEFAULTS_BASE = MappingProxyType(
+    {
+        "mem": "16GB",
+        "chk": "Gaussian.chk",
+        "sp": "",
+        "scf": ["maxcycle=250", "xqc"],
+        "integral": "ultrafine",
+        "nosymmetry": "",
+        "pop": "CM5",
+        "gfinput": "",
+        "ioplist": ["6/7=3", "2/9=2000"],  # see ASE issue #660
+    }
+)
+_RELAX_DEFAULTS_BASE = MappingProxyType(
+    {
+        "mem": "16GB",
+        "chk": "Gaussian.chk",
+        "pop": "CM5",
+        "scf": ["maxcycle=250", "xqc"],
+        "integral": "ultrafine",
+        "nosymmetry": "",
+        "ioplist": ["2/9=2000"],  # see ASE issue #660
+    }
+)
+
 
 @job
 def static_job(
@@ -27,6 +73,7 @@ def static_job(
     spin_multiplicity: int,
     xc: str = "wb97x-d",
     basis: str = "def2-tzvp",
+    chk_file: str | None = None,
     calc_swaps: dict | None = None,
     copy_files: list[str] | None = None,
 ) -> cclibSchema:
@@ -41,7 +88,7 @@ def static_job(
         {
             "mem": "16GB",
             "chk": "Gaussian.chk",
-            "nprocshared": multiprocessing.cpu_count(),
+            "nprocshared": _NPROCSHARED,
             "xc": xc,
             "basis": basis,
             "charge": charge,
@@ -69,6 +116,11 @@ def static_job(
         Exchange-correlation functional
     basis
         Basis set
+    chk_file
+        Path to a checkpoint file from a previous job, whose converged
+        wavefunction will be used as the initial SCF guess (i.e. `guess=read`).
+        The path returned as `"chk_file"` in the output summary of a previous
+        Gaussian job can be supplied here directly.
     calc_swaps
         Dictionary of custom kwargs for the calculator.
     copy_files
@@ -81,20 +133,12 @@ def static_job(
     """
 
     defaults = {
-        "mem": "16GB",
-        "chk": "Gaussian.chk",
-        "nprocshared": multiprocessing.cpu_count(),
+        **_STATIC_DEFAULTS_BASE,
+        "nprocshared": _NPROCSHARED,
         "xc": xc,
         "basis": basis,
         "charge": charge,
         "mult": spin_multiplicity,
-        "sp": "",
-        "scf": ["maxcycle=250", "xqc"],
-        "integral": "ultrafine",
-        "nosymmetry": "",
-        "pop": "CM5",
-        "gfinput": "",
-        "ioplist": ["6/7=3", "2/9=2000"],  # see ASE issue #660
     }
     return _base_job(
         atoms,
@@ -102,6 +146,7 @@ def static_job(
         spin_multiplicity=spin_multiplicity,
         defaults=defaults,
         calc_swaps=calc_swaps,
+        chk_file=chk_file,
         additional_fields={"name": "Gaussian Static"},
         copy_files=copy_files,
     )
@@ -115,6 +160,7 @@ def relax_job(
     xc: str = "wb97x-d",
     basis: str = "def2-tzvp",
     freq: bool = False,
+    chk_file: str | None = None,
     calc_swaps: dict | None = None,
     copy_files: list[str] | None = None,
 ) -> cclibSchema:
@@ -129,7 +175,7 @@ def relax_job(
         {
             "mem": "16GB",
             "chk": "Gaussian.chk",
-            "nprocshared": multiprocessing.cpu_count(),
+            "nprocshared": _NPROCSHARED,
             "xc": xc,
             "basis": basis,
             "charge": charge,
@@ -159,8 +205,19 @@ def relax_job(
         Basis set
     freq
         If a frequency calculation should be carried out.
+    chk_file
+        Path to a checkpoint file from a previous job, whose converged
+        wavefunction will be used as the initial SCF guess (i.e. `guess=read`).
+        The path returned as `"chk_file"` in the output summary of a previous
+        Gaussian job can be supplied here directly.
     calc_swaps
-        Dictionary of custom kwargs for the calculator.
+        Dictionary of custom kwargs for the calculator. Set
+        `{"use_native_opt": True}` to drive the geometry loop with Gaussian's
+        internal optimizer via `ase.calculators.gaussian.GaussianOptimizer`,
+        which keeps the optimization within a single Gaussian invocation
+        instead of spawning one Gaussian process per step. Set
+        `{"use_native_irc": True}` for the analogous
+        `ase.calculators.gaussian.GaussianIRC` path.
     copy_files
         Files to copy to the runtime directory.
 
@@ -170,45 +227,138 @@ def relax_job(
         Dictionary of results, as specified in [quacc.schemas.cclib.cclib_summarize_run][]
     """
 
+    calc_swaps = dict(calc_swaps) if calc_swaps else {}
+    use_native_opt = calc_swaps.pop("use_native_opt", False)
+    use_native_irc = calc_swaps.pop("use_native_irc", False)
+    runner = (
+        _native_dynamics_runner(GaussianIRC if use_native_irc else GaussianOptimizer)
+        if use_native_opt or use_native_irc
+        else None
+    )
+
     defaults = {
-        "mem": "16GB",
-        "chk": "Gaussian.chk",
-        "nprocshared": multiprocessing.cpu_count(),
+        **_RELAX_DEFAULTS_BASE,
+        "nprocshared": _NPROCSHARED,
         "xc": xc,
         "basis": basis,
         "charge": charge,
         "mult": spin_multiplicity,
-        "opt": "",
-        "pop": "CM5",
-        "scf": ["maxcycle=250", "xqc"],
-        "integral": "ultrafine",
-        "nosymmetry": "",
-        "freq": "" if freq else None,
-        "ioplist": ["2/9=2000"],  # ASE issue #660
     }
+    if not use_native_irc:
+        defaults["opt"] = ""
+    if freq:
+        defaults["freq"] = ""
     return _base_job(
         atoms,
         charge=charge,
         spin_multiplicity=spin_multiplicity,
         defaults=defaults,
         calc_swaps=calc_swaps,
+        runner=runner,
+        chk_file=chk_file,
         additional_fields={"name": "Gaussian Relax"},
         copy_files=copy_files,
     )
 
 
+def _failed_convergence(logfile: str) -> bool:
+    """
+    Check if a Gaussian log file ends in a convergence failure that might be
+    cured by escalating the convergence settings, i.e. an SCF convergence
+    failure (l502) or a geometry optimization that ran out of steps (l9999).
+    Other error terminations (bad route sections, basis set or memory errors)
+    are not retryable.
+
+    Parameters
+    ----------
+    logfile
+        Path to the Gaussian log file.
+
+    Returns
+    -------
+    bool
+        True if the log shows a retryable convergence failure.
+    """
+
+    return check_logfile(logfile, "Convergence failure") or check_logfile(
+        logfile, "Error termination request processed by link 9999"
+    )
+
+
+def _is_chk_file(filename: str | Path) -> bool:
+    """
+    Check if a file is a Gaussian checkpoint file, possibly gzipped.
+
+    Parameters
+    ----------
+    filename
+        The filename to check.
+
+    Returns
+    -------
+    bool
+        True if the file is a checkpoint file, False otherwise.
+    """
+
+    return str(filename).removesuffix(".gz").endswith(".chk")
+
+
+def _native_dynamics_runner(
+    dynamics: type[GaussianDynamics],
+) -> Callable[[Atoms], None]:
+    """
+    Make a runner function that drives a calculation with one of Gaussian's
+    internal driver routines, i.e. `ase.calculators.gaussian.GaussianOptimizer`
+    or `ase.calculators.gaussian.GaussianIRC`.
+
+    Parameters
+    ----------
+    dynamics
+        The `ase.calculators.gaussian.GaussianDynamics` subclass to use.
+
+    Returns
+    -------
+    Callable
+        A function that runs the dynamics on an Atoms object with an attached
+        Gaussian calculator, suitable for the `fn_hook` argument of
+        [quacc.runners.calc.run_calc][].
+    """
+
+    def runner(atoms: Atoms) -> None:
+        run_kwargs = {}
+        route_flags = atoms.calc.parameters.get(dynamics.keyword)
+        if route_flags:
+            run_kwargs[dynamics.keyword] = route_flags
+        dynamics(atoms).run(**run_kwargs)
+
+        # The dynamics resets the calculator when it is done, so the results
+        # need to be re-read from the log file for the summarizer.
+        if not atoms.calc.results:
+            atoms.calc.read_results()
+
+    return runner
+
+
 def _base_job(
     atoms: Atoms | dict,
     charge: int,
     spin_multiplicity: int,
     defaults: dict | None = None,
     calc_swaps: dict | None = None,
+    runner: Callable[[Atoms], None] | None = None,
+    chk_file: str | None = None,
     additional_fields: dict | None = None,
     copy_files: list[str] | None = None,
 ) -> cclibSchema:
     """
     Base job function for carrying out Gaussian recipes.
 
+    If the calculation fails with an SCF convergence failure or a geometry
+    optimization that ran out of steps, the convergence settings are escalated
+    (`scf=(maxcycle=512,yqc)`, plus `opt=(maxcycles=100)` for optimizations)
+    and the job is re-run once from the checkpoint of the failed attempt
+    before being summarized. Other failures are re-raised.
+
     Parameters
     ----------
     atoms
@@ -222,6 +372,17 @@ def _base_job(
         Default parameters for the calculator.
     calc_swaps
         Dictionary of custom kwargs for the calculator.
+    runner
+        A custom function to run the calculation instead of
+        atoms.get_potential_energy(), e.g. one made by
+        [quacc.recipes.gaussian.core._native_dynamics_runner][].
+    chk_file
+        Path to a checkpoint file from a previous job to use as the initial
+        SCF guess. It is prepended to `copy_files` and `guess=read` is added
+        to the defaults. The same handoff is triggered if `copy_files`
+        already contains a `.chk` file. Checkpoint files are staged under the
+        name that the `chk` route section points to, and a `FileNotFoundError`
+        is raised if `chk_file` does not exist.
     additional_fields
         Additional fields to supply to the summarizer.
     copy_files
@@ -230,13 +391,109 @@ def _base_job(
     Returns
     -------
     cclibSchema
-        Dictionary of results, as specified in [quacc.schemas.cclib.cclib_summarize_run][]
+        Dictionary of results, as specified in
+        [quacc.schemas.cclib.cclib_summarize_run][]. The path to the produced
+        checkpoint file is stored under the `"chk_file"` key so that it can be
+        chained into a follow-up job.
     """
     atoms = fetch_atoms(atoms)
+
+    if chk_file:
+        chk_path = Path(zpath(str(Path(chk_file).resolve())))
+        if not chk_path.exists():
+            msg = f"Checkpoint file {chk_file} does not exist."
+            raise FileNotFoundError(msg)
+        copy_files = [str(chk_path)] + (copy_files or [])
+    if copy_files:
+        # Resolve to absolute paths up-front since a retry is staged from a
+        # different working directory.
+        copy_files = [str(Path(f).resolve()) for f in copy_files]
+    if copy_files and any(_is_chk_file(f) for f in copy_files):
+        defaults = merge_dicts(defaults, {"guess": "read"})
+
     flags = merge_dicts(defaults, calc_swaps)
 
+    # Gaussian reads the guess from the file that %chk points to, so any
+    # checkpoint staged under a different name is copied to a staging
+    # directory and renamed to match before being copied to the runtime
+    # directory.
+    staging_dir = None
+    if copy_files and flags.get("chk"):
+        for i, f in enumerate(copy_files):
+            src = Path(zpath(f))
+            if (
+                _is_chk_file(f)
+                and src.name.removesuffix(".gz") != flags["chk"]
+                and src.exists()
+            ):
+                if staging_dir is None:
+                    staging_dir = Path(
+                        mkdtemp(prefix="quacc-chk-", dir=SETTINGS.SCRATCH_DIR)
+                    )
+                staged = Path(
+                    staging_dir,
+                    flags["chk"] + (".gz" if src.name.endswith(".gz") else ""),
+                )
+                copy(src, staged)
+                copy_files[i] = str(staged)
+
     atoms.calc = Gaussian(**flags)
-    atoms = run_calc(atoms, geom_file=GEOM_FILE, copy_files=copy_files)
+    try:
+        atoms = run_calc(
+            atoms, geom_file=GEOM_FILE, copy_files=copy_files, fn_hook=runner
+        )
+    except CalculationFailed:
+        # run_calc aborted before its cleanup step, so the working directory
+        # is still the scratch tmpdir and the log and checkpoint of the failed
+        # attempt only exist there.
+        failed_dir = Path.cwd()
+        log_path = Path(failed_dir, LOG_FILE)
+        if not log_path.exists() or not _failed_convergence(str(log_path)):
+            raise
+
+        # Escalate the convergence settings and retry once, reusing the
+        # checkpoint file so the second attempt starts from the near-converged
+        # density rather than from scratch. Only the last attempt is
+        # summarized.
+        retry_flags = {"scf": ["maxcycle=512", "yqc"]}
+        if "opt" in flags:
+            # Append maxcycles to any user-supplied opt options (e.g. a TS
+            # search) instead of replacing them.
+            opt_flags = flags["opt"] or ""
+            if not isinstance(opt_flags, str):
+                opt_flags = ",".join(opt_flags)
+            opt_flags = [
+                o.strip()
+                for o in opt_flags.split(",")
+                if o.strip() and not o.strip().lower().startswith("maxcycle")
+            ]
+            retry_flags["opt"] = [*opt_flags, "maxcycles=100"]
+        failed_chk = Path(failed_dir, flags["chk"]) if flags.get("chk") else None
+        if failed_chk and failed_chk.exists():
+            retry_flags["guess"] = "read"
+            copy_files = (copy_files or []) + [str(failed_chk)]
+        flags = merge_dicts(flags, retry_flags)
+
+        atoms.calc = Gaussian(**flags)
+        atoms = run_calc(
+            atoms, geom_file=GEOM_FILE, copy_files=copy_files, fn_hook=runner
+        )
+
+        # The failed attempt's scratch directory (and its symlink in the
+        # results directory) is only kept around for debugging hard failures,
+        # so remove it now that the retry has succeeded, mirroring
+        # _calc_cleanup.
+        rmtree(failed_dir, ignore_errors=True)
+        Path(Path.cwd(), f"{failed_dir.name}-symlink").unlink(missing_ok=True)
+
+    if staging_dir:
+        rmtree(staging_dir, ignore_errors=True)
+
+    if flags.get("chk"):
+        additional_fields = merge_dicts(
+            additional_fields,
+            {"chk_file": zpath(str(Path(Path.cwd(), flags["chk"])))},
+        )
 
     return cclib_summarize_run(
         atoms,
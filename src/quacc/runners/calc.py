@@ -27,12 +27,17 @@ except ImportError:
     Sella = None
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     from ase import Atoms
     from ase.optimize.optimize import Optimizer
 
 
 def run_calc(
-    atoms: Atoms, geom_file: str | None = None, copy_files: list[str] | None = None
+    atoms: Atoms,
+    geom_file: str | None = None,
+    copy_files: list[str] | None = None,
+    fn_hook: Callable[[Atoms], None] | None = None,
 ) -> Atoms:
     """
     Run a calculation in a scratch directory and copy the results back to the
@@ -54,6 +59,11 @@ def run_calc(
         varies between codes.
     copy_files
         Filenames to copy from source to scratch directory.
+    fn_hook
+        A custom function to call on the Atoms object to run the calculation
+        instead of atoms.get_potential_energy(). Useful for calculators with
+        their own driver routines, e.g. the native Gaussian optimizer. The
+        function is called inside the scratch directory.
 
     Returns
     -------
@@ -64,8 +74,11 @@ def run_calc(
     # Perform staging operations
     atoms, tmpdir, job_results_dir = _calc_setup(atoms, copy_files=copy_files)
 
-    # Run calculation via get_potential_energy()
-    atoms.get_potential_energy()
+    # Run calculation via get_potential_energy() or the custom hook
+    if fn_hook:
+        fn_hook(atoms)
+    else:
+        atoms.get_potential_energy()
 
     # Most ASE calculators do not update the atoms object in-place with a call
     # to .get_potential_energy(), which is important if an internal optimizer is
@@ -35,7 +35,7 @@ def check_logfile(logfile: str, check_str: str) -> bool:
         True if the string is found in the logfile, False otherwise.
     """
     zlog = zpath(logfile)
-    with zopen(zlog, "r") as f:
+    with zopen(zlog, "rt") as f:
         for line in f:
             clean_line = line if isinstance(line, str) else line.decode("utf-8")
             if check_str.lower() in clean_line.lower():
@@ -1,5 +1,8 @@
+from pathlib import Path
+
 import pytest
 from ase.build import molecule
+from monty.os.path import zpath
 
 from quacc import SETTINGS
 
@@ -89,3 +92,120 @@ def test_relax_job(tmpdir):
     assert output["parameters"]["basis"] == "def2-svp"
     assert output["parameters"]["integral"] == "superfinegrid"
     assert output["parameters"]["ioplist"] == ["2/9=2000"]  # see ASE issue #660
+
+
+def test_static_job_chk_handoff(tmpdir):
+    from quacc.recipes.gaussian.core import static_job
+
+    tmpdir.chdir()
+
+    atoms = molecule("H2")
+
+    output = static_job(atoms, 0, 1)
+    assert output["chk_file"].endswith("Gaussian.chk")
+    assert "guess" not in output["parameters"]
+
+    chk = Path(tmpdir, "Gaussian.chk")
+    chk.touch()
+
+    output = static_job(atoms, 0, 1, chk_file=str(chk))
+    assert output["parameters"]["guess"] == "read"
+    assert output["chk_file"].endswith(("Gaussian.chk", "Gaussian.chk.gz"))
+
+    output = static_job(atoms, 0, 1, copy_files=[str(chk)])
+    assert output["parameters"]["guess"] == "read"
+
+    output = static_job(atoms, 0, 1, chk_file=str(chk), calc_swaps={"guess": "mix"})
+    assert output["parameters"]["guess"] == "mix"
+
+    # A checkpoint with a different basename is staged under the name that
+    # %chk points to so that guess=read can find it.
+    renamed_chk = Path(tmpdir, "previous_job.chk")
+    renamed_chk.write_text("previous wavefunction")
+    output = static_job(atoms, 0, 1, chk_file=str(renamed_chk))
+    assert output["parameters"]["guess"] == "read"
+    assert Path(zpath(output["chk_file"].removesuffix(".gz"))).exists()
+    assert not Path(SETTINGS.RESULTS_DIR, "previous_job.chk.gz").exists()
+
+    with pytest.raises(FileNotFoundError):
+        static_job(atoms, 0, 1, chk_file="missing.chk")
+
+
+def test_relax_job_auto_retry(tmpdir, monkeypatch):
+    from ase import Atoms
+    from ase.calculators.calculator import CalculationFailed
+
+    from quacc.recipes.gaussian.core import relax_job, static_job
+
+    tmpdir.chdir()
+
+    atoms = molecule("H2")
+
+    # Simulate an SCF convergence failure on the first attempt: the process
+    # dies like the real Gaussian binary would, leaving a log with the
+    # failure signature and a checkpoint in the scratch directory. The second
+    # attempt only succeeds because the checkpoint got staged into its
+    # runtime directory.
+    mocked_gpe = Atoms.get_potential_energy
+
+    def mock_failing_gpe(self, **kwargs):
+        if not Path("Gaussian.chk").exists():
+            Path("Gaussian.log").write_text(" Convergence failure -- run terminated.\n")
+            Path("Gaussian.chk").write_text("near-converged density")
+            msg = "Calculator gaussian failed"
+            raise CalculationFailed(msg)
+        return mocked_gpe(self, **kwargs)
+
+    monkeypatch.setattr(Atoms, "get_potential_energy", mock_failing_gpe)
+
+    output = relax_job(atoms, 0, 1)
+    assert output["natoms"] == len(atoms)
+    assert output["parameters"]["scf"] == ["maxcycle=512", "yqc"]
+    assert output["parameters"]["opt"] == ["maxcycles=100"]
+    assert output["parameters"]["guess"] == "read"
+
+    # User-supplied opt options (e.g. a TS search) survive the retry.
+    output = relax_job(atoms, 0, 1, calc_swaps={"opt": "ts,calcfc,noeigentest"})
+    assert output["parameters"]["opt"] == [
+        "ts",
+        "calcfc",
+        "noeigentest",
+        "maxcycles=100",
+    ]
+
+    # Error terminations that escalated convergence settings cannot cure are
+    # re-raised instead of being retried.
+    def mock_fatal_gpe(self, **kwargs):
+        Path("Gaussian.log").write_text(
+            " Error termination via Lnk1e in /software/g16/l301.exe\n"
+        )
+        msg = "Calculator gaussian failed"
+        raise CalculationFailed(msg)
+
+    monkeypatch.setattr(Atoms, "get_potential_energy", mock_fatal_gpe)
+
+    with pytest.raises(CalculationFailed):
+        static_job(atoms, 0, 1)
+
+
+def test_relax_job_native_opt(tmpdir, monkeypatch):
+    from ase.calculators.gaussian import GaussianDynamics
+
+    from quacc.recipes.gaussian.core import relax_job
+
+    tmpdir.chdir()
+
+    def mock_dynamics_run(self, **kwargs):
+        self.atoms.get_potential_energy()
+        return True
+
+    monkeypatch.setattr(GaussianDynamics, "run", mock_dynamics_run)
+
+    atoms = molecule("H2")
+
+    output = relax_job(atoms, 0, 1, calc_swaps={"use_native_opt": True})
+    assert output["natoms"] == len(atoms)
+    assert output["parameters"]["charge"] == 0
+    assert output["parameters"]["mult"] == 1
+    assert output["parameters"]["opt"] == ""
+    assert "use_native_opt" not in output["parameters"]